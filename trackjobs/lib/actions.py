@@ -20,8 +20,11 @@
 
 """Collection of functions to perform various database actions. Can be called from CLI."""
 
+import functools
 import os
+import re
 import subprocess
+from collections.abc import Iterable
 from datetime import date
 from pathlib import Path
 from typing import Any
@@ -31,86 +34,160 @@ import polars as pl
 
 from .aux import convert
 from .default import CMD_FN
+from .default import COL_CHECKED
 from .default import schema_template
+from .default import schema_template_polars
 
 # pylint: enable=import-error
 
+_REGEX_META = frozenset(".*+?[](){}|\\^$")
+"""Characters which indicate that a filter value is a regular expression"""
 
-def _check_if_id_exists(database: pl.DataFrame, job_id: str) -> bool:
-    """Check if a job with the given ID exists in the database.
+_JOB_ID_SEP_RE = re.compile(r"[_.\[]")
+"""Separators after the base job ID of (pbs and slurm) array jobs, i.e., '_', '.' or '['"""
+
+
+def _existing_ids(database: pl.LazyFrame, job_ids: list[str]) -> set[str]:
+    """Get the IDs from a list of job IDs that are already used in the database.
+
+    Only the ID column is read and the filter is pushed down into the scan of the database file.
+
+    Args:
+        database (pl.LazyFrame): The LazyFrame containing the database.
+        job_ids (List[str]): The job IDs to look for.
+
+    Returns:
+        Set[str]: The job IDs which exist in the database.
+    """
+
+    return set(database.select("ID").filter(pl.col("ID").is_in(job_ids)).collect()["ID"])
+
+
+def _row_of(database: pl.DataFrame, job_id: str) -> int | None:
+    """Get the row index of a job in the (collected) database.
+
+    Jobs are stored in the order they were added. If the ID column is flagged as sorted (see
+    `io.load`), the row is located by binary search without allocating a mask or index column,
+    otherwise it is searched linearly.
 
     Args:
-        database (pl.DataFrame): The DataFrame containing the database.
-        job_id (str): The job ID to check.
+        database (pl.DataFrame): The DataFrame containing (at least) the ID column of the
+            database.
+        job_id (str): The job ID to look for.
 
     Returns:
-        bool: True if the job ID exists, False otherwise.
+        Optional[int]: Index of the row with the given job ID or None if no such job exists.
     """
 
-    return len(database.filter(pl.col("ID") == job_id)) > 0
+    ids = database["ID"]
+    if ids.flags["SORTED_ASC"]:
+        idx = ids.search_sorted(job_id)
+        if idx < len(ids) and ids[idx] == job_id:
+            return idx
+        return None
+
+    rows = (ids == job_id).arg_true()
+    return rows[0] if len(rows) > 0 else None
 
 
 def add_job(
-    database: pl.DataFrame, job_id: str, job_name: str, directory: str, job_script: str
-) -> pl.DataFrame:
+    database: pl.LazyFrame, job_id: str, job_name: str, directory: str, job_script: str
+) -> pl.LazyFrame:
     """Add a new job to the database.
 
     Args:
-        database (pl.DataFrame): The DataFrame containing the database.
+        database (pl.LazyFrame): The LazyFrame containing the database.
         job_id (int): The unique identifier for the job.
         job_name (str): The name of the job.
         directory (str): The directory where the job script is located.
         job_script (str): The path to the job script.
 
     Returns:
-        pl.DataFrame: The updated DataFrame with the new job added.
+        pl.LazyFrame: The updated LazyFrame with the new job added.
 
     Raises:
         ValueError: if there is already a job with job_id in the database.
     """
 
-    id_exists = _check_if_id_exists(database, job_id)
-    if id_exists:
-        raise ValueError(f"ERROR: Job with ID {job_id} already exists in database!")
-
-    job_data = schema_template()
+    # fresh row with the columns of the schema, the shared template itself is not modified
+    job_data = dict.fromkeys(schema_template())
 
     job_data["ID"] = job_id
     job_data["Name"] = job_name
     job_data["Directory"] = directory
     job_data["Job_script"] = job_script
     job_data["Status"] = None
-    job_data["Checked?"] = False
+    job_data[COL_CHECKED] = False
     job_data["Comments"] = None
     job_data["Date"] = date.today().isoformat()
 
-    missing_cols = set(database.schema).difference(set(job_data))
-    if len(missing_cols) > 0:
-        job_data.update({k: None for k in missing_cols})
+    return add_jobs(database, [job_data])
+
+
+def add_jobs(database: pl.LazyFrame, rows: list[dict[str, Any]]) -> pl.LazyFrame:
+    """Add one or more new jobs to the database.
+
+    All jobs are appended at once, using the fixed schema from `schema_template_polars` (no
+    schema inference). Columns of the database missing in the rows are filled with nulls.
+
+    Args:
+        database (pl.LazyFrame): The LazyFrame containing the database.
+        rows (List[Dict[str, Any]]): One dictionary per job, mapping the fields of the schema
+            template to their values.
+
+    Returns:
+        pl.LazyFrame: The updated LazyFrame with the new jobs added.
+
+    Raises:
+        ValueError: if there is already a job with one of the IDs in the database.
+    """
+
+    existing_ids = _existing_ids(database, [row["ID"] for row in rows])
+    new_ids = set()
+    for row in rows:
+        if row["ID"] in new_ids or row["ID"] in existing_ids:
+            raise ValueError(f"ERROR: Job with ID {row["ID"]} already exists in database!")
+        new_ids.add(row["ID"])
 
-    df_new = pl.DataFrame(job_data).select(database.columns)
+    df_new = pl.LazyFrame(rows, schema=schema_template_polars())
 
-    return database.vstack(df_new)
+    return pl.concat([database, df_new], how="diagonal_relaxed")
 
 
-def delete_job(database: pl.DataFrame, job_id: str) -> pl.DataFrame:
+def delete_job(database: pl.LazyFrame, job_id: str) -> pl.LazyFrame:
     """Delete a job from the database.
 
     Args:
-        database (pl.DataFrame): The DataFrame containing the database.
+        database (pl.LazyFrame): The LazyFrame containing the database.
         job_id (int): The ID of the job to delete.
 
     Returns:
-        pl.DataFrame: The updated DataFrame with the job removed.
+        pl.LazyFrame: The updated LazyFrame with the job removed.
+    """
+    return delete_many(database, [job_id])
+
+
+def delete_many(database: pl.LazyFrame, job_ids: list[str]) -> pl.LazyFrame:
+    """Delete one or more jobs from the database.
+
+    Args:
+        database (pl.LazyFrame): The LazyFrame containing the database.
+        job_ids (List[str]): The IDs of the jobs to delete.
+
+    Returns:
+        pl.LazyFrame: The updated LazyFrame with the jobs removed.
     """
-    return database.filter(pl.col("ID") != job_id)
+    return database.filter(~pl.col("ID").is_in(job_ids))
 
 
-def get_dir(database: pl.DataFrame, job_id: str) -> Path:
+def get_dir(database: pl.LazyFrame, job_id: str) -> Path:
     """Get the directory of a specific job from the database.
 
+    Note that the CLI first tries to look up the directory in the index written next to the
+    database (see `io.load_dir_index`), which does not require Polars.
+
     Args:
-        database (pl.DataFrame): The DataFrame containing the database.
+        database (pl.LazyFrame): The LazyFrame containing the database.
         job_id (int): The ID of the job to retrieve the directory for.
 
     Returns:
@@ -118,24 +195,25 @@ def get_dir(database: pl.DataFrame, job_id: str) -> Path:
             if no job with given ID was found.
     """
 
-    row = database.filter(pl.col("ID") == job_id)
-    if len(row) == 0:
+    df = database.select("ID", "Directory").collect()
+    idx = _row_of(df, job_id)
+    if idx is None:
         print("WARNING: no job with specified ID was found! Returning current directory!")
         return Path(os.getcwd())
-    return Path(row["Directory"][0])
+    return Path(df["Directory"][idx])
 
 
 def set_status(
-    database: pl.DataFrame,
+    database: pl.LazyFrame,
     job_id: str,
     status: str,
     comment: str | None = None,
     checked: bool = False,
-) -> pl.DataFrame:
+) -> pl.LazyFrame:
     """Set the status of a specific job in the database.
 
     Args:
-        database (pl.DataFrame): The DataFrame containing the database.
+        database (pl.LazyFrame): The LazyFrame containing the database.
         job_id (int): The ID of the job to update.
         status (str): The new status for the job.
         comment (Optional[str]): An optional comment to add (appends comment to
@@ -143,45 +221,69 @@ def set_status(
         checked (bool): Flag indicating if the job was checked by the user. Defaults to False.
 
     Returns:
-        pl.DataFrame: The updated DataFrame with the job status and optionally a comment.
+        pl.LazyFrame: The updated LazyFrame with the job status and optionally a comment.
     """
-    database = database.with_columns(
-        pl.when(pl.col("ID") == job_id)
+    return set_status_many(database, [job_id], status, comment, checked)
+
+
+def set_status_many(
+    database: pl.LazyFrame,
+    job_ids: list[str],
+    status: str,
+    comment: str | None = None,
+    checked: bool = False,
+) -> pl.LazyFrame:
+    """Set the same status to one or more jobs in the database.
+
+    All selected jobs are updated in a single pass over the database.
+
+    Args:
+        database (pl.LazyFrame): The LazyFrame containing the database.
+        job_ids (List[str]): The IDs of the jobs to update.
+        status (str): The new status for the jobs.
+        comment (Optional[str]): An optional comment to add (appends comment to
+            existing comments). Defaults to None.
+        checked (bool): Flag indicating if the jobs were checked by the user. Defaults to False.
+
+    Returns:
+        pl.LazyFrame: The updated LazyFrame with the job status and optionally a comment.
+    """
+    mask = pl.col("ID").is_in(job_ids)
+    status_dtype = schema_template_polars()["Status"]
+    updates = [
+        pl.when(mask)
         .then(pl.lit(status))
         .otherwise(pl.col("Status"))
+        .cast(status_dtype)
         .alias("Status")
-    )
+    ]
 
     if comment is not None:
-        database = database.with_columns(
-            pl.when(pl.col("ID") == job_id)
-            .then(
-                pl.when(pl.col("Comments").is_null())
-                .then(pl.lit(comment))
-                .otherwise(pl.col("Comments") + pl.lit(f"\n{comment}"))
-            )
+        updates.append(
+            pl.when(mask & pl.col("Comments").is_null())
+            .then(pl.lit(comment))
+            .when(mask)
+            .then(pl.col("Comments") + pl.lit(f"\n{comment}"))
             .otherwise(pl.col("Comments"))
             .alias("Comments")
         )
 
     if checked:
-        database = database.with_columns(
-            pl.when(pl.col("ID") == job_id)
-            .then(pl.lit(True))
-            .otherwise(pl.col("Checked?"))
-            .alias("Checked?")
+        updates.append(
+            pl.when(mask).then(pl.lit(True)).otherwise(pl.col(COL_CHECKED)).alias(COL_CHECKED)
         )
 
-    return database
+    # single pass over the database instead of one with_columns call per updated column
+    return database.with_columns(updates)
 
 
 def set_value(
-    database: pl.DataFrame, job_id: str, column: str, value: Any, convert_type=True
-) -> pl.DataFrame:
+    database: pl.LazyFrame, job_id: str, column: str, value: Any, convert_type=True
+) -> pl.LazyFrame:
     """Set a value for a specific column of a job in the database.
 
     Args:
-        database (pl.DataFrame): The DataFrame containing the database.
+        database (pl.LazyFrame): The LazyFrame containing the database.
         job_id (int): The ID of the job to update.
         column (str): The name of the column to update.
         value (Any): The new value for the column.
@@ -189,48 +291,57 @@ def set_value(
             correct type. Defaults to True.
 
     Returns:
-        pl.DataFrame: The updated DataFrame with the job value set.
+        pl.LazyFrame: The updated LazyFrame with the job value set.
 
     Raises:
         ValueError: When attempting to update job_id with a value that is used
             as job_id for a different job.
     """
 
-    if not _check_if_id_exists(database, job_id):
+    existing_ids = _existing_ids(database, [job_id, value] if column == "ID" else [job_id])
+    if job_id not in existing_ids:
         raise ValueError(f"ERROR: Cannot update job. No job with ID {job_id} exists in database!")
 
     if column == "ID":  # make sure that new ID is not used yet in database.
-        if _check_if_id_exists(database, value):
+        if value in existing_ids:
             raise ValueError(
                 f"ERROR: Cannot update ID. Another job with ID {value} already exists in database!"
             )
 
+    dtype = database.collect_schema()[column]
     if convert_type:
-        dtype = database[column].dtype
         value = convert(value, dtype)
 
+    # cast keeps the dtype of the column (e.g. categorical), when/then would return a string
     database = database.with_columns(
-        pl.when(pl.col("ID") == job_id).then(pl.lit(value)).otherwise(pl.col(column)).alias(column)
+        pl.when(pl.col("ID") == job_id)
+        .then(pl.lit(value))
+        .otherwise(pl.col(column))
+        .cast(dtype)
+        .alias(column)
     )
 
     return database
 
 
 def filter_jobs(
-    database: pl.DataFrame, key: str, value: str, match_exactly: bool = False
-) -> pl.DataFrame:
+    database: pl.LazyFrame, key: str, value: str, match_exactly: bool = False
+) -> pl.LazyFrame:
     """Filter the jobs in the database based on a specific column and value.
 
     Args:
-        database (pl.DataFrame): The DataFrame containing the database.
+        database (pl.LazyFrame): The LazyFrame containing the database.
         key (str): The column to filter by.
-        value (Any): The value to filter for.
+        value (Any): The value to filter for. For string columns, jobs containing the value are
+            selected (the value is interpreted as regular expression if it contains any regex
+            metacharacters).
+        match_exactly (bool): Select only jobs with exactly the given value. Defaults to False.
 
     Returns:
-        pl.DataFrame: The filtered DataFrame.
+        pl.LazyFrame: The filtered LazyFrame.
     """
 
-    dtype = database[key].dtype
+    dtype = database.collect_schema()[key]
     value = convert(value, dtype)
 
     if isinstance(dtype, pl.Boolean):
@@ -238,12 +349,37 @@ def filter_jobs(
     elif isinstance(dtype, (pl.Int64, pl.Int32)) or match_exactly:
         database = database.filter(pl.col(key) == value)
     else:
-        database = database.filter(pl.col(key).str.contains(value))
+        # values without regex metacharacters are matched as plain substrings (no regex engine)
+        literal = _REGEX_META.isdisjoint(value)
+        column = pl.col(key).cast(pl.String) if isinstance(dtype, pl.Categorical) else pl.col(key)
+        database = database.filter(column.str.contains(value, literal=literal))
 
     return database
 
 
-def check_status(database: pl.DataFrame, result_list: list[str] | None) -> pl.DataFrame | None:
+def parse_status_lines(lines: Iterable[str]) -> list[tuple[str, str]]:
+    """Parse the output of the command querying the queueing system.
+
+    Every (non-empty) line gives a job ID and its status. For (pbs and slurm) array jobs, the base
+    job ID is returned.
+
+    Args:
+        lines (Iterable[str]): The output lines of the command, e.g. a file object or a list.
+
+    Returns:
+        List[Tuple[str, str]]: The job ID and status of every job listed in the output.
+    """
+
+    fields = (line.replace('"', "").strip().split(maxsplit=1) for line in lines)
+    return [
+        (_JOB_ID_SEP_RE.split(job_id, maxsplit=1)[0], status)
+        for job_id, status in filter(None, fields)
+    ]
+
+
+def check_status(
+    database: pl.LazyFrame, job_status: list[tuple[str, str]] | None
+) -> pl.LazyFrame | None:
     """Query the queueing system for the status of unchecked jobs.
 
     This function requires a file storing the command to query the queueing system. The first line
@@ -251,49 +387,49 @@ def check_status(database: pl.DataFrame, result_list: list[str] | None) -> pl.Da
     If the file does not exist, it will be created with a default command for the slurm scheduler.
 
     Args:
-        database (pl.DataFrame): The DataFrame containing the database.
-        result_list (list): list with IDs of jobs running/queueing.
+        database (pl.LazyFrame): The LazyFrame containing the database.
+        job_status (list): ID and status of the jobs running/queueing (see
+            `parse_status_lines`).
 
     Returns:
-        pl.DataFrame: The updated DataFrame or None if the command for querrying the queueing
+        pl.LazyFrame: The updated LazyFrame or None if the command for querrying the queueing
             sysem fails.
     """
-    if result_list is None:
-        result_list = []
+    if job_status is None:
+        job_status = []
 
-    df_unchecked = database.filter(pl.col("Checked?").eq(False)).select(pl.col("ID"))
+    df_unchecked = database.filter(pl.col(COL_CHECKED).eq(False)).select(pl.col("ID")).collect()
     unchecked = set(df_unchecked["ID"])
 
-    for line in result_list:
-        if not line:
-            continue
-
-        job_id, status = line.replace('"', "").strip().split(maxsplit=1)
-
-        # should account for pbs and slurm array jobs:
-        job_id = job_id.split("_")[0].split(".")[0].split("[")[0]
-
-        if job_id in unchecked:
-            database = set_status(database, job_id, status)
-            unchecked.remove(job_id)
-
-    for job_id in unchecked:
-        database = set_status(database, job_id, "Finished?")
+    # reversed, so that the first line listing a job (e.g. of an array job) gives its status
+    updates = {job_id: status for job_id, status in reversed(job_status) if job_id in unchecked}
+    remaining = unchecked - updates.keys()
+
+    # unchecked jobs no longer known to the scheduler are finished, everything is updated in a
+    # single expression instead of calling set_status for every job
+    status_expr = (
+        pl.when(pl.col("ID").is_in(list(updates)))
+        .then(pl.col("ID").replace_strict(updates, default=pl.col("Status")))
+        .when(pl.col("ID").is_in(list(remaining)))
+        .then(pl.lit("Finished?"))
+        .otherwise(pl.col("Status"))
+        .cast(schema_template_polars()["Status"])
+    )
 
-    return database
+    return database.with_columns(status_expr.alias("Status"))
 
 
 def set_status_jobs(
-    database: pl.DataFrame,
+    database: pl.LazyFrame,
     job_ids: list[str],
     status: str,
     comment: str | None,
     this: bool = False,
-) -> pl.DataFrame:
+) -> pl.LazyFrame:
     """Set the same status to one or more jobs in the database.
 
     Args:
-        database (pl.DataFrame): The DataFrame containing the database.
+        database (pl.LazyFrame): The LazyFrame containing the database.
         job_ids (List[int]): The IDs of thes job to update.
         status (str): The new status for the jobs.
         comment (Optional[str]): An optional comment to add (appends comment to existing comments).
@@ -301,25 +437,21 @@ def set_status_jobs(
         this (bool): Flag indicating that the status should be set to jobs in current directory.
 
     Returns:
-        pl.DataFrame: The updated DataFrame with the job status and optionally a comment.
+        pl.LazyFrame: The updated LazyFrame with the job status and optionally a comment.
     """
 
     if this:
         cwd = os.getcwd()
-        db = filter_jobs(database, "Directory", cwd, True)
+        db = filter_jobs(database, "Directory", cwd, True).select("ID", COL_CHECKED).collect()
         if len(db) == 0:
             print(f"ERROR: No job found in the current working directory ({cwd})!")
             return database
-        db = filter_jobs(db, "Checked?", "False")
-        job_ids = db["ID"].to_list()
+        job_ids = db.filter(pl.col(COL_CHECKED).eq(False))["ID"].to_list()
 
-    for job_id in job_ids:
-        database = set_status(database, job_id, status, comment, True)
-
-    return database
+    return set_status_many(database, list(job_ids), status, comment, True)
 
 
-def compare_jobs(database: pl.DataFrame, job_ids: list[str], this: bool) -> pl.DataFrame:
+def compare_jobs(database: pl.LazyFrame, job_ids: list[str], this: bool) -> pl.DataFrame:
     """Compare multiple jobs and return differences.
 
     Filters the database to show selected jobs, then identifies which
@@ -327,7 +459,7 @@ def compare_jobs(database: pl.DataFrame, job_ids: list[str], this: bool) -> pl.D
     are identical across all jobs are printed to stdout and excluded
     from the returned DataFrame.
     Args:
-        database (pl.DataFrame): The DataFrame containing the job database.
+        database (pl.LazyFrame): The LazyFrame containing the job database.
         job_ids (List[int]): List of job IDs to compare. Can be empty if
             `this` is True.
         this (bool): If True, select jobs from current working directory.
@@ -341,7 +473,7 @@ def compare_jobs(database: pl.DataFrame, job_ids: list[str], this: bool) -> pl.D
     if this:
         job_ids = _get_jobs_pwd(database)
 
-    db_comp = database.filter(pl.col("ID").is_in(job_ids))
+    db_comp = database.filter(pl.col("ID").is_in(job_ids)).collect()
 
     if len(db_comp) == 0:
         return db_comp
@@ -357,7 +489,7 @@ def compare_jobs(database: pl.DataFrame, job_ids: list[str], this: bool) -> pl.D
 
 
 def _get_jobs_pwd(
-    database: pl.DataFrame, filter_key: str | None = None, filter_value: str | None = None
+    database: pl.LazyFrame, filter_key: str | None = None, filter_value: str | None = None
 ) -> list[str]:
     """Get job IDs from jobs in the current working directory.
 
@@ -365,7 +497,7 @@ def _get_jobs_pwd(
     optionally applies an additional filter.
 
     Args:
-        database (pl.DataFrame): The DataFrame containing the job database.
+        database (pl.LazyFrame): The LazyFrame containing the job database.
         filter_key (Optional[str]): Optional column name for additional filtering.
         filter_value (Optional[str]): Optional value for additional filtering.
             Must be provided if filter_key is provided.
@@ -376,25 +508,26 @@ def _get_jobs_pwd(
     """
 
     cwd = os.getcwd()
-    db = filter_jobs(database, "Directory", cwd, True)
-    if len(db) == 0:
-        raise ValueError(f"No jobs found in directory: {cwd}")
-
+    database = filter_jobs(database, "Directory", cwd, True)
     if filter_key is not None and filter_value is not None:
-        db = filter_jobs(db, filter_key, filter_value)
-    return db["ID"].to_list()
+        database = filter_jobs(database, filter_key, filter_value)
+
+    job_ids = database.select("ID").collect()["ID"].to_list()
+    if len(job_ids) == 0:
+        raise ValueError(f"No jobs found in directory: {cwd}")
+    return job_ids
 
 
 def get_unchecked_ids():
-    """Retrieve job status lines from the scheduler (e.g., SLURM).
+    """Retrieve job status from the scheduler (e.g., SLURM).
 
     Reads a command template from CMD_FN (creating the file with a default
     ``squeue`` invocation if it does not exist), executes it as a subprocess,
-    and returns the raw stdout lines.
+    and parses its output line by line while the command runs (see `parse_status_lines`).
 
     Returns:
-        List[str] or None: List of job-status lines (e.g. ``["12345 PENDING", "12346 RUNNING"]``),
-            one per job reported by the scheduler command, or ``None`` if the subprocess failed
+        List[Tuple[str, str]] or None: Job ID and status (e.g. ``("12345", "PENDING")``) of every
+            job reported by the scheduler command, or ``None`` if the subprocess failed
             (e.g. squeue not available).
     """
 
@@ -403,18 +536,38 @@ def get_unchecked_ids():
         with open(CMD_FN, "wt", encoding="utf-8") as cmd_fn:
             cmd_fn.write('squeue\n--noheader\n--format="%.18i %.9T"')
 
-    with open(CMD_FN, "rt", encoding="utf-8") as cmd_fn:
-        cmd = cmd_fn.readlines()
-        cmd = [line.strip() for line in cmd]
+    cmd = list(_load_cmd(CMD_FN, os.path.getmtime(CMD_FN)))
 
     try:
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, check=True)
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, encoding="utf-8") as proc:
+            job_status = parse_status_lines(proc.stdout) if proc.stdout is not None else []
     except FileNotFoundError:
         print(f"\nERROR: Command ({cmd[0]}) for checking running jobs failed!")
         return None
-    except subprocess.CalledProcessError:
+
+    if proc.returncode != 0:
         print("\nERROR: Command to check running jobs failed!", end=" ")
         print(f"Make sure the command specified in {CMD_FN} runs without errors!")
         return None
 
-    return result.stdout.decode("utf-8").strip().split("\n")
+    return job_status
+
+
+@functools.lru_cache(maxsize=4)
+def _load_cmd(path: str, mtime: float) -> tuple[str, ...]:
+    # pylint: disable=unused-argument
+    """Read the command for querying the job scheduler from file.
+
+    The result is cached, so the file is only parsed again if it was modified (mtime is part of
+    the cache key).
+
+    Args:
+        path (str): Path to the file containing the command (one argument per line).
+        mtime (float): Modification time of the file.
+
+    Returns:
+        Tuple[str, ...]: The command and its arguments.
+    """
+
+    with open(path, "rt", encoding="utf-8") as cmd_fn:
+        return tuple(line.strip() for line in cmd_fn)
@@ -23,11 +23,15 @@ Module containing auxiliary functions.
 """
 
 from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 # pylint: disable=import-error
 import polars as pl
 
+_TRUE = frozenset({"true", "t", "1", "yes"})
+_FALSE = frozenset({"false", "f", "0", "no"})
+
 
 def convert(value: str, dtype: pl.DataType) -> Any:
     """Convert a string value to a specified data type.
@@ -35,27 +39,39 @@ def convert(value: str, dtype: pl.DataType) -> Any:
     Args:
         value (str): The string value to be converted.
         dtype (str): The target data type to which the value should be converted. Supported
-            types include "Boolean", "Float64", "Float32", and "Int64".
+            types include "Boolean", "Float64", "Float32", "Int64" and "Int32"; values for
+            other types are returned unchanged.
 
     Returns:
         Any: The converted value in the specified data type.
 
     Raises:
-        ValueError: If the conversion fails or if an unsupported data type is provided.
+        ValueError: If the conversion fails.
     """
 
-    if isinstance(dtype, pl.Boolean):
-        if value.lower().strip() not in {"true", "false"}:
-            raise ValueError(f"ERROR: Cannot convert '{value}' to bool!")
-        if value.lower().startswith("t"):
-            return True
-        return False
-    if isinstance(dtype, (pl.Float64, pl.Float32)):
-        return _try_convert(value, float)
-    if isinstance(dtype, (pl.Int64, pl.Int32)):
-        return _try_convert(value, int)
+    conv_fct = _CONVERTERS.get(dtype.base_type())
+    return conv_fct(value) if conv_fct is not None else value
+
+
+def _to_bool(value: str) -> bool:
+    """Convert a string value to bool.
+
+    Args:
+        value (str): The string value to be converted (e.g. "true", "False", "t", "0").
+
+    Returns:
+        bool: The converted value.
 
-    return value
+    Raises:
+        ValueError: If the value does not represent a boolean.
+    """
+
+    value_norm = value.strip().lower()
+    if value_norm in _TRUE:
+        return True
+    if value_norm in _FALSE:
+        return False
+    raise ValueError(f"ERROR: Cannot convert '{value}' to bool!")
 
 
 def _try_convert(value: str, conv_fct: Callable[[str], int | float]) -> int | float:
@@ -79,3 +95,13 @@ def _try_convert(value: str, conv_fct: Callable[[str], int | float]) -> int | fl
         raise ValueError(f"ERROR: Cannot convert {value} to {conv_fct}") from exc
 
     return value_conv
+
+
+_CONVERTERS: dict[type[pl.DataType], Callable[[str], Any]] = {
+    pl.Boolean: _to_bool,
+    pl.Float64: partial(_try_convert, conv_fct=float),
+    pl.Float32: partial(_try_convert, conv_fct=float),
+    pl.Int64: partial(_try_convert, conv_fct=int),
+    pl.Int32: partial(_try_convert, conv_fct=int),
+}
+"""Conversion function for each supported (base) data type"""
@@ -18,17 +18,24 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 
-"""Module defining command line interface (CLI)."""
+"""Module defining command line interface (CLI).
 
+Polars (and the modules depending on it) are imported inside the commands which need them, as
+importing Polars takes most of the start-up time of commands like print-dir.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import importlib.util
 import os
+from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Optional
 
 # pylint: disable=import-error
 # import click
-import polars as pl
 import rich_click as click
 
-from . import actions
 from .cli_flags import flg_this
 from .cli_flags import opt_comment
 from .cli_flags import opt_dir
@@ -41,17 +48,46 @@ from .cli_flags import requires_key
 from .cli_flags import requires_multiple_ids
 from .cli_flags import requires_name
 from .cli_flags import requires_value
+from .default import COL_CHECKED
 from .default import HELP_MAX_WIDTH
 from .default import JOB_DB
 from .default import THEME
 from .io import load
+from .io import load_dir_index
 from .io import save
 
+if TYPE_CHECKING:
+    import polars as pl
+
 # pylint: enable=import-error
 
 
+class _Group(click.RichGroup):
+    """Command group which imports the remote subcommand only when it is requested.
+
+    The remote subcommand requires fabric and Polars, importing them for every command would slow
+    down commands that need neither.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        commands = super().list_commands(ctx)
+        if importlib.util.find_spec("fabric") is not None:
+            commands = sorted([*commands, "remote"])
+        return commands
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name == "remote":
+            try:
+                from trackjobs.remote.cli_remote import remote
+            except ImportError:
+                return None
+            return remote
+        return super().get_command(ctx, cmd_name)
+
+
 @click.group(
     "cli",
+    cls=_Group,
     context_settings={"help_option_names": ["-h", "--help"]},
     invoke_without_command=True,
 )
@@ -60,20 +96,23 @@ from .io import save
 def cli(ctx):
     """CLI entry point"""
     ctx.ensure_object(dict)
-    ctx.obj["db"] = load(JOB_DB)
+    if ctx.invoked_subcommand != "print-dir":  # print-dir loads the database only if needed
+        ctx.obj["db"] = load(JOB_DB)
     if ctx.invoked_subcommand is None:
         ctx.invoke(show_unchecked)
 
 
 @cli.result_callback()
-def results(database: Optional[pl.DataFrame] = None):
+def results(database: Optional["pl.LazyFrame"] = None):
     """Callback function called before program ends. Used to save database.
 
+    This is the only place where the full database is collected.
+
     Args:
-        database (Optional[pl.DataFrame]): Dataframe to write to disk.
+        database (Optional[pl.LazyFrame]): LazyFrame to collect and write to disk.
     """
     if database is not None:
-        save(JOB_DB, database)
+        save(JOB_DB, database.collect(engine="streaming"))
 
 
 @cli.command(short_help="""Add job to database. Requires specification of ID (-I), Name (-N).
@@ -89,6 +128,8 @@ def results(database: Optional[pl.DataFrame] = None):
 def add(obj, job_id, job_name, job_script, job_dir, comment, job_status):
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     """Add job to database."""
+    from . import actions
+
     database = obj["db"]
     if job_dir is None:
         job_dir = os.getcwd()
@@ -106,9 +147,10 @@ def add(obj, job_id, job_name, job_script, job_dir, comment, job_status):
 @requires_multiple_ids
 def delete(obj, job_ids):
     """Delete job from database."""
+    from . import actions
+
     database = obj["db"]
-    for job_id in job_ids:
-        database = actions.delete_job(database, job_id)
+    database = actions.delete_many(database, list(job_ids))
     return database
 
 
@@ -120,6 +162,8 @@ def delete(obj, job_ids):
 @requires_value
 def mod(obj, job_id, key, value):
     """Modify job in database."""
+    from . import actions
+
     database = obj["db"]
     database = actions.set_value(database, job_id, key, value)
     return database
@@ -130,13 +174,22 @@ def mod(obj, job_id, key, value):
     short_help="""Print directory of job selected by ID (-I) or last unchecked job (if called
     without the -I parameter).""",
 )
-@click.pass_obj
 @opt_id
-def print_dir(obj, job_id):
+def print_dir(job_id):
     """Print directory of job."""
-    database = obj["db"]
+    if job_id is not None:
+        dir_index = load_dir_index(JOB_DB)
+        if dir_index is not None and dir_index.get(job_id) is not None:
+            click.echo(Path(dir_index[job_id]))
+            return
+
+    import polars as pl
+
+    from . import actions
+
+    database = load(JOB_DB)
     if job_id is None:
-        unchecked = database.filter(pl.col("Checked?").eq(False))
+        unchecked = database.filter(pl.col(COL_CHECKED).eq(False)).select("ID", "Date").collect()
         if len(unchecked) >= 1:
             unchecked = unchecked.sort("Date")
             job_id = unchecked[-1, 0]
@@ -154,21 +207,26 @@ def print_dir(obj, job_id):
 @requires_multiple_ids
 def show(obj, job_ids):
     """Show selected job."""
+    import polars as pl
+
     database = obj["db"]
 
     with pl.Config(tbl_cols=-1, set_tbl_rows=-1, fmt_str_lengths=500):
-        click.echo(database.filter(pl.col("ID").is_in(job_ids)))
+        click.echo(database.filter(pl.col("ID").is_in(job_ids)).collect())
 
 
 @cli.command("show-all", short_help="Show all jobs in database.")
 @click.pass_obj
 def show_all(obj):
     """Show all jobs in database."""
+    import polars as pl
+
     database = obj["db"]
     with pl.Config(tbl_cols=-1, set_tbl_rows=-1, fmt_str_lengths=80):
-        exclude_cols = [c for c in database.columns if c.lower().find("directory") > -1]
+        columns = database.collect_schema().names()
+        exclude_cols = [c for c in columns if c.lower().find("directory") > -1]
         database = database.select(pl.exclude(exclude_cols))
-        click.echo(database)
+        click.echo(database.collect())
 
 
 @cli.command(
@@ -180,16 +238,17 @@ def show_all(obj):
 @click.option("--only-IDs", "only_ids", is_flag=True, help="Only print IDs")
 def show_unchecked(obj, only_ids: bool):
     """Show all jobs with status that have not been marked as checked by the user."""
+    import polars as pl
+
     database = obj["db"]
-    database = database.filter(pl.col("Checked?").eq(False)).select(
-        pl.col("*").exclude("Directory")
-    )
+    # filter and projection are pushed down into the scan of the database file
+    database = database.filter(pl.col(COL_CHECKED).eq(False)).select(pl.exclude("Directory"))
 
     if only_ids:
-        database = database["ID"].to_frame()
+        database = database.select("ID")
 
     with pl.Config(tbl_rows=-1, tbl_cols=-1):
-        click.echo(database.with_row_index(offset=1))
+        click.echo(database.with_row_index(offset=1).collect(engine="streaming"))
 
 
 @cli.command(
@@ -202,6 +261,8 @@ def show_unchecked(obj, only_ids: bool):
 @requires_value
 def show_filtered(ctx, key, value):
     """Filter database."""
+    from . import actions
+
     database = ctx.obj["db"]
     database = actions.filter_jobs(database, key, value)
     ctx.obj["db"] = database
@@ -224,6 +285,8 @@ def set_fail(obj, job_ids, comment, this):
     Note: multiple jobs can be selected to set the status, but the comment will be the same for
     all selected jobs.
     """
+    from . import actions
+
     database = obj["db"]
     database = actions.set_status_jobs(database, job_ids, "FAILED", comment, this)
     return database
@@ -245,6 +308,8 @@ def set_ok(obj, job_ids, comment, this):
     Note: multiple jobs can be selected to set the status, but the comment will be the same for
     all selected jobs.
     """
+    from . import actions
+
     database = obj["db"]
     database = actions.set_status_jobs(database, job_ids, "OK", comment, this)
     return database
@@ -259,6 +324,8 @@ def set_ok(obj, job_ids, comment, this):
 @requires_value
 def update_id(obj, job_id, value):
     """Replace job ID with a new one."""
+    from . import actions
+
     database = obj["db"]
     database = actions.set_value(database, job_id, "ID", value)
     return database
@@ -274,11 +341,13 @@ def update_id(obj, job_id, value):
 @click.option("-s", "--save", "save_sorted", is_flag=True, help="Save sorted database")
 def sort(obj, key, desc, save_sorted):
     """Sort database."""
+    import polars as pl
+
     database = obj["db"]
     database = database.sort(key, descending=desc)
 
     with pl.Config(tbl_cols=-1, set_tbl_rows=-1, fmt_str_lengths=80):
-        click.echo(database.select(pl.col("*").exclude("Directory")))
+        click.echo(database.select(pl.col("*").exclude("Directory")).collect())
 
     if save_sorted:
         return database
@@ -297,6 +366,8 @@ def sort(obj, key, desc, save_sorted):
 )
 def check_status(ctx, print_unchecked):
     """Check status of jobs by querying job scheduler."""
+    from . import actions
+
     database = ctx.obj["db"]
 
     click.echo("Checking status of jobs...", nl=False)
@@ -329,14 +400,8 @@ def tail(ctx, n: int):
 @flg_this
 def compare(obj, job_ids, this):
     """Compare jobs by ID or current directory."""
+    from . import actions
+
     database = obj["db"]
     diff = actions.compare_jobs(database, job_ids, this)
     click.echo(diff)
-
-
-try:
-    from trackjobs.remote.cli_remote import remote
-
-    cli.add_command(remote)
-except ImportError:
-    pass
@@ -22,33 +22,66 @@
 Module defining default values
 """
 
+import functools
 import os
 
-JOB_DB = os.path.expanduser("~/job_db.polars")  # Path where job database is stored
+JOB_DB = os.path.expanduser("~/job_db.parquet")  # Path where job database is stored
 
 CMD_FN = os.path.expanduser("~/.config/track_jobs/check_status_command")
 """Path to file that has command that gives job status (e.g. squeue)"""
 
+COL_CHECKED = "Checked?"  # Column flagging jobs whose status was checked by the user
+
 THEME = "solarized-box"  # Theme for CLI (see rich-click documentation for alternatives)
 HELP_MAX_WIDTH = 80  # Maximum width (in characters) of help messages
 
 
+# Fields of the job database and their Python types, in column order
+_SCHEMA_ITEMS = (
+    ("ID", str),
+    ("Name", str),
+    ("Job_script", str),
+    ("Status", str),
+    (COL_CHECKED, bool),
+    ("Comments", str),
+    ("Directory", str),
+    ("Date", str),
+)
+_SCHEMA = dict(_SCHEMA_ITEMS)
+
+# Text fields with many repeated values, stored as categorical columns in the database
+CATEGORICAL_COLUMNS = ("Name", "Status")
+
+
 def schema_template() -> dict:
     """Return a template for a data schema.
 
+    The same dictionary is returned on every call, so it must not be modified by the caller.
+
     Returns:
         dict: A dictionary where each key is a field name and each value is the expected data
         type for that field.
     """
-    schema = {
-        "ID": str,
-        "Name": str,
-        "Job_script": str,
-        "Status": str,
-        "Checked?": bool,
-        "Comments": str,
-        "Directory": str,
-        "Date": str,
-    }
+    return _SCHEMA
+
 
-    return schema
+@functools.cache
+def schema_template_polars() -> dict:
+    """Return the data schema of the database with Polars data types.
+
+    The schema is only built once, so the returned dictionary must not be modified by the caller.
+
+    Returns:
+        dict: A dictionary where each key is a field name and each value is the Polars data
+        type of that field.
+    """
+    # pylint: disable=import-outside-toplevel, import-error
+    # imported here, since importing default should not require Polars
+    import polars as pl
+
+    dtypes = {str: pl.String, bool: pl.Boolean}
+
+    return {
+        name: pl.Categorical if name in CATEGORICAL_COLUMNS else dtypes[dtype]
+        for name, dtype in _SCHEMA_ITEMS
+    }
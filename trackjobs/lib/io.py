@@ -20,50 +20,196 @@
 
 """
 Module for io operations.
+
+Polars is only imported by the functions reading the database, so that the directory index can
+be read without importing Polars.
 """
 
+# pylint: disable=import-outside-toplevel
+
+import json
 import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .default import CATEGORICAL_COLUMNS
+from .default import COL_CHECKED
+from .default import schema_template_polars
+
+if TYPE_CHECKING:
+    # pylint: disable=import-error
+    import polars as pl
+
+_SORTED_KEY = "sorted"  # Parquet metadata key giving the column the database is sorted by
+
+
+def load(filename: str) -> "pl.LazyFrame":
+    """Lazily load data from a file into a Polars LazyFrame or create empty LazyFrame.
+
+    If the file does not exist, but a database in the old CSV format (same path with suffix
+    ".polars") does, the old database is read and converted to the new format once.
+
+    Note that the file is only read when the returned LazyFrame is collected.
+
+    Args:
+        filename (str): The path to the file from which data should be loaded.
+            Files with suffix ".parquet" are scanned using `polars.scan_parquet`, all other files
+            are scanned as CSV using `polars.scan_csv`.
+
+    Returns:
+        pl.LazyFrame: A Polars LazyFrame for the data in the specified file
+            or empty LazyFrame with specified schema.
+    """
+
+    import polars as pl
+
+    legacy_filename = str(Path(filename).with_suffix(".polars"))
 
-# pylint: disable=import-error
-import polars as pl
+    if not os.path.isfile(filename):
+        if filename == legacy_filename or not os.path.isfile(legacy_filename):
+            return pl.LazyFrame(schema=schema_template_polars())
+        # one-shot migration of CSV database, jobs keep their order (load never re-sorts them)
+        save(filename, _scan(legacy_filename).collect())
 
-# pylint: enable=import-error
-from .default import schema_template
+    # Jobs are stored in the order they were added (or saved by `sort --save`). If this order
+    # is also sorted by ID, the flag allows binary search when looking up jobs.
+    database = _scan(filename)
+    if _saved_sorted(filename):
+        return database.set_sorted("ID")
+    return database
 
 
-def load(filename: str) -> pl.DataFrame:
-    """Load data from a file into a Polars DataFrame or create empty DataFrame.
+def _scan(filename: str) -> "pl.LazyFrame":
+    """Scan database in Parquet or (legacy) CSV format, depending on file suffix.
 
     Args:
         filename (str): The path to the file from which data should be loaded.
-            If the file exists, it is read as a CSV using `polars.read_csv`.
 
     Returns:
-        pl.DataFrame: A Polars DataFrame containing the data read from the specified file
-            or empty DataFrame with specified schema.
+        pl.LazyFrame: A Polars LazyFrame for the data in the specified file.
     """
 
-    if os.path.isfile(filename):
-        df = pl.read_csv(filename, has_header=True)
-        df = df.rename({"Finished": "Checked?"}, strict=False)  # renamed column in version 0.3.0
+    import polars as pl
 
-        # Make sure ID column is string, might be neded if database was created with earlier
-        # version of code. Added in version 0.6.0
-        df = df.with_columns(pl.col("ID").cast(pl.String))
-        return df
+    # CSV files and Parquet files written by earlier versions store these columns as strings
+    categorical = pl.col(CATEGORICAL_COLUMNS).cast(pl.Categorical)
 
-    schema = schema_template()
+    if filename.endswith(".parquet"):
+        return pl.scan_parquet(filename).with_columns(categorical)
 
-    return pl.DataFrame(schema=schema)
+    df = pl.scan_csv(filename, has_header=True)
+    df = df.rename({"Finished": COL_CHECKED}, strict=False)  # renamed column in version 0.3.0
 
+    # Make sure ID column is string, might be neded if database was created with earlier
+    # version of code. Added in version 0.6.0
+    return df.with_columns(pl.col("ID").cast(pl.String), categorical)
 
-def save(filename: str, database: pl.DataFrame):
-    """Save a Polars DataFrame to a CSV file.
+
+def _saved_sorted(filename: str) -> bool:
+    """Check whether a database file was saved sorted by ID.
+
+    Only the footer of the file is read, not the data.
+
+    Args:
+        filename (str): The path of the database file.
+
+    Returns:
+        bool: True if the file is a Parquet file whose metadata marks it as sorted by ID.
+    """
+
+    import polars as pl
+
+    if not filename.endswith(".parquet"):
+        return False
+
+    return pl.read_parquet_metadata(filename).get(_SORTED_KEY) == "ID"
+
+
+def save(filename: str, database: "pl.DataFrame", dir_index: bool = True):
+    """Save a Polars DataFrame to a Parquet (or CSV) file.
 
     Args:
         filename (str): The path to the file where the data should be saved.
-            The DataFrame is written as a CSV using `polars.write_csv`, including the header row.
-        database (pl.DataFrame): The Polars DataFrame to be saved.
+            Files with suffix ".parquet" are written with zstd compression and column statistics
+            (allowing to skip row groups when filtering), all other files are written as CSV
+            including the header row. If the jobs happen to be in ID order, this is recorded in
+            the metadata of Parquet files, so that `load` can flag the ID column as sorted
+            without checking the data.
+        database (pl.DataFrame): The Polars DataFrame to be saved. A LazyFrame returned by `load`
+            needs to be collected before saving it to the file it was loaded from.
+        dir_index (bool): Flag indicating whether to also write the directory index (see
+            `load_dir_index`) next to the database file. Defaults to True.
+    """
+
+    # Files are written to a temporary file first and then moved in place, so that an
+    # interrupted write cannot leave a truncated database behind.
+    temp_filename = _temp_filename(filename)
+    try:
+        if filename.endswith(".parquet"):
+            metadata = {_SORTED_KEY: "ID"} if database["ID"].is_sorted() else None
+            database.write_parquet(
+                temp_filename, compression="zstd", statistics=True, metadata=metadata
+            )
+        else:
+            database.write_csv(temp_filename, include_header=True)
+        os.replace(temp_filename, filename)
+
+        if dir_index:  # written after the database, so the index is never older than it
+            index_filename = _dir_index_filename(filename)
+            temp_filename = _temp_filename(index_filename)
+            with open(temp_filename, "wt", encoding="utf-8") as index_file:
+                json.dump(dict(zip(database["ID"], database["Directory"])), index_file)
+            os.replace(temp_filename, index_filename)
+    finally:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+
+
+def load_dir_index(filename: str) -> dict[str, str] | None:
+    """Load the index mapping job IDs to job directories written by `save`.
+
+    Reading this small JSON file is much faster than reading the database, e.g. for printing
+    the directory of a job.
+
+    Args:
+        filename (str): The path of the database file the index belongs to.
+
+    Returns:
+        Optional[Dict[str, str]]: Dictionary mapping job IDs to directories or None if the index
+            does not exist or is older than the database file.
+    """
+
+    index_filename = _dir_index_filename(filename)
+    try:
+        if os.path.getmtime(index_filename) < os.path.getmtime(filename):
+            return None
+        with open(index_filename, "rt", encoding="utf-8") as index_file:
+            return json.load(index_file)
+    except (OSError, ValueError):
+        return None
+
+
+def _dir_index_filename(filename: str) -> str:
+    """Return the path of the directory index belonging to a database file.
+
+    Args:
+        filename (str): The path of the database file.
+
+    Returns:
+        str: The path of the directory index.
+    """
+
+    return f"{filename}.idx.json"
+
+
+def _temp_filename(filename: str) -> str:
+    """Return the path of the temporary file used while writing a file.
+
+    Args:
+        filename (str): The path of the file to be written.
+
+    Returns:
+        str: The path of the temporary file (in the same directory, unique per process).
     """
 
-    database.write_csv(filename, include_header=True)
+    return f"{filename}.tmp.{os.getpid()}"
@@ -59,27 +59,29 @@ def load_host(host: str) -> dict[str, Any]:
     return hosts[host]
 
 
-def _remote_fetch(conn: fabric.Connection, host_conf: dict[str, Any]) -> pl.DataFrame:
-    """Downloads a remote CSV database file from a host and loads it into a Polars DataFrame.
+def _remote_fetch(conn: fabric.Connection, host_conf: dict[str, Any]) -> pl.LazyFrame:
+    """Downloads a remote database file from a host and loads it into a Polars LazyFrame.
 
     This helper function creates a local temporary file to store the remote data
     before reading it into memory. The temporary file is deleted after the
-    DataFrame is loaded.
+    data is loaded.
 
     Args:
         conn (fabric.Connection): An active Fabric connection object (SSH) to the remote host.
         host_conf (dict[str, Any]): Configuration dictionary containing:
-            - 'remote_job_db_path': The absolute path to the CSV file on the remote host.
+            - 'remote_job_db_path': The absolute path to the database file on the remote host
+              (Parquet if the suffix is ".parquet", CSV otherwise).
             - 'hostname': The name of the host (used for error reporting).
 
     Returns:
-        pl.DataFrame: A Polars DataFrame containing the data from the remote CSV.
+        pl.LazyFrame: A Polars LazyFrame containing the data from the remote database.
 
     Raises:
         FileNotFoundError: If the file at `remote_job_db_path` does not exist on the host.
         ValueError: If the `remote_job_db_path` key is missing or invalid in `host_conf`.
     """
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tmp_file:
+    suffix = os.path.splitext(host_conf.get("remote_job_db_path") or "")[1]
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
         temp_path = tmp_file.name
 
     try:
@@ -90,7 +92,8 @@ def _remote_fetch(conn: fabric.Connection, host_conf: dict[str, Any]) -> pl.Data
         ) from exc
     except KeyError as exc:
         raise KeyError("Path for remote job database not set!") from exc
-    df_remote = io.load(temp_path)
+    # collect before removing the temporary file, io.load only scans the file
+    df_remote = io.load(temp_path).collect().lazy()
 
     if os.path.exists(temp_path):
         os.remove(temp_path)
@@ -98,16 +101,16 @@ def _remote_fetch(conn: fabric.Connection, host_conf: dict[str, Any]) -> pl.Data
     return df_remote
 
 
-def _add_remote_cols(df_remote: pl.DataFrame, host_conf: dict[str, Any]) -> pl.DataFrame:
+def _add_remote_cols(df_remote: pl.LazyFrame, host_conf: dict[str, Any]) -> pl.LazyFrame:
     """Renames remote columns and adds host-specific identifiers and localized paths.
 
-    This function transforms the remote DataFrame by renaming generic columns to
+    This function transforms the remote LazyFrame by renaming generic columns to
     'Remote' versions, generating a unique global ID by combining the hostname
     with the remote ID, and optionally translating remote directory paths
     to local equivalents.
 
     Args:
-        df_remote (pl.DataFrame): The Polars DataFrame fetched from the remote host.
+        df_remote (pl.LazyFrame): The Polars LazyFrame fetched from the remote host.
         host_conf (dict[str, Any]): Configuration dictionary containing:
             - 'hostname': The name of the host.
             - 'remote_base_path': The base directory path on the remote system
@@ -116,7 +119,7 @@ def _add_remote_cols(df_remote: pl.DataFrame, host_conf: dict[str, Any]) -> pl.D
               local system (can be None).
 
     Returns:
-        pl.DataFrame: The transformed DataFrame with renamed columns, a
+        pl.LazyFrame: The transformed LazyFrame with renamed columns, a
             unique 'ID', a 'Host' column, and an updated 'Directory' column.
     """
     df_remote = df_remote.rename({"Directory": "Remote_directory", "ID": "Remote_ID"})
@@ -137,10 +140,11 @@ def _add_remote_cols(df_remote: pl.DataFrame, host_conf: dict[str, Any]) -> pl.D
     return df_remote
 
 
-def _remote_put(conn: fabric.Connection, host_conf: dict[str, Any], database: pl.DataFrame):
-    """Writes a Polars DataFrame to a CSV and uploads it to a remote host.
+def _remote_put(conn: fabric.Connection, host_conf: dict[str, Any], database: pl.LazyFrame):
+    """Writes a Polars LazyFrame to a file and uploads it to a remote host.
 
-    This helper function saves the provided DataFrame to a local temporary CSV file,
+    This helper function collects and saves the provided LazyFrame to a local temporary file
+    (in the format given by the suffix of the remote database path),
     transfers that file to the remote path specified in the host configuration,
     and then cleans up the temporary local file.
 
@@ -149,17 +153,18 @@ def _remote_put(conn: fabric.Connection, host_conf: dict[str, Any], database: pl
         host_conf (dict[str, Any]): Configuration dictionary containing:
             - 'remote_job_db_path': The destination path on the remote host.
             - 'hostname': The name of the host (used for error reporting).
-        database (pl.DataFrame): The Polars DataFrame to be uploaded.
+        database (pl.LazyFrame): The Polars LazyFrame to be uploaded.
 
     Raises:
         FileNotFoundError: If the destination path `remote_job_db_path` is invalid
             or unreachable on the remote host.
         ValueError: If the `remote_job_db_path` key is missing or not set in `host_conf`.
     """
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tmp_file:
+    suffix = os.path.splitext(host_conf.get("remote_job_db_path") or "")[1]
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
         temp_path = tmp_file.name
 
-    database.write_csv(temp_path)
+    io.save(temp_path, database.collect(), dir_index=False)
 
     try:
         conn.put(temp_path, host_conf["remote_job_db_path"])
@@ -175,12 +180,12 @@ def _remote_put(conn: fabric.Connection, host_conf: dict[str, Any], database: pl
 
 
 def remote_merge_from(
-    conn: fabric.Connection, host_conf: dict[str, Any], db_local: pl.DataFrame
-) -> pl.DataFrame:
-    """Fetches a remote database and merges its contents into the local DataFrame.
+    conn: fabric.Connection, host_conf: dict[str, Any], db_local: pl.LazyFrame
+) -> pl.LazyFrame:
+    """Fetches a remote database and merges its contents into the local LazyFrame.
 
-    This function retrieves a remote CSV, processes it to add host-specific
-    identifiers, ensures the local DataFrame has all necessary columns to
+    This function retrieves a remote database, processes it to add host-specific
+    identifiers, ensures the local LazyFrame has all necessary columns to
     prevent schema mismatches, and performs a full outer join (update) based
     on the unique 'ID'.
 
@@ -188,10 +193,10 @@ def remote_merge_from(
         conn (fabric.Connection): An active Fabric connection object to the remote host.
         host_conf (dict[str, Any]): Configuration dictionary containing the
             remote path and hostname.
-        db_local (pl.DataFrame): The current local Polars DataFrame to be updated.
+        db_local (pl.LazyFrame): The current local Polars LazyFrame to be updated.
 
     Returns:
-        pl.DataFrame: A merged Polars DataFrame containing the combined records
+        pl.LazyFrame: A merged Polars LazyFrame containing the combined records
             from both the local and remote sources or None if remote job database does
             not exist.
 
@@ -206,18 +211,19 @@ def remote_merge_from(
     db_remote = db_remote.with_columns(pl.col("ID").cast(pl.String))
 
     db_remote = _add_remote_cols(db_remote, host_conf)
-    new_cols = [c for c in db_remote.columns if c not in db_local.columns]
+    local_cols = db_local.collect_schema().names()
+    new_cols = [c for c in db_remote.collect_schema().names() if c not in local_cols]
 
     return db_local.with_columns([pl.lit(None).alias(c) for c in new_cols]).update(
         db_remote, on="ID", how="full"
     )
 
 
-def remote_merge_to(conn: fabric.Connection, host_conf: dict[str, Any], db_local: pl.DataFrame):
+def remote_merge_to(conn: fabric.Connection, host_conf: dict[str, Any], db_local: pl.LazyFrame):
     """Merges local data into a remote database and uploads the result to the host.
 
     This function retrieves the current remote database, filters the local
-    DataFrame for records belonging to the target host, strips away local
+    LazyFrame for records belonging to the target host, strips away local
     identifiers to revert to the remote schema, and performs a full outer
     join to synchronize the data. The final merged dataset is then uploaded
     back to the remote host.
@@ -227,12 +233,12 @@ def remote_merge_to(conn: fabric.Connection, host_conf: dict[str, Any], db_local
         host_conf (dict[str, Any]): Configuration dictionary containing:
             - 'hostname': The name of the host to filter for and upload to.
             - 'remote_job_db_path': The destination path on the remote host.
-        db_local (pl.DataFrame): The local Polars DataFrame containing
+        db_local (pl.LazyFrame): The local Polars LazyFrame containing
             aggregated data from multiple hosts.
 
     See Also:
         _remote_fetch: Used to retrieve the current remote state.
-        _remote_put: Used to upload the synchronized DataFrame.
+        _remote_put: Used to upload the synchronized database.
     """
     db_remote = _remote_fetch(conn, host_conf)
     # Make sure ID column is string, might be neded if database was created with earlier
@@ -250,8 +256,10 @@ def remote_merge_to(conn: fabric.Connection, host_conf: dict[str, Any], db_local
     _remote_put(conn, host_conf, db_remote)
 
 
-def get_unchecked_ids(conn: fabric.Connection, host_conf: dict[str, Any]) -> list[str] | None:
-    """Retrieves a list of unchecked job IDs from a remote host.
+def get_unchecked_ids(
+    conn: fabric.Connection, host_conf: dict[str, Any]
+) -> list[tuple[str, str]] | None:
+    """Retrieves the status of unchecked jobs from a remote host.
 
     This function executes a specific shell command on the remote host to identify
     jobs that have not yet been checked. The resulting IDs are prefixed with the
@@ -264,13 +272,15 @@ def get_unchecked_ids(conn: fabric.Connection, host_conf: dict[str, Any]) -> lis
             - 'hostname': The name of the host used to prefix the resulting IDs.
 
     Returns:
-        Optional[List[str]]: A list of unique global IDs (hostname + ID) if
-            unchecked jobs are found; None if the command output is empty.
+        Optional[List[Tuple[str, str]]]: Unique global IDs (hostname + ID) and status of the jobs
+            (see `actions.parse_status_lines`) if unchecked jobs are found; None if the command
+            output is empty.
     """
     result = conn.run(host_conf["check_jobs_command"], hide=True)
 
     if result.stdout:
-        return [f"{host_conf["hostname"]}{i.strip()}" for i in result.stdout.strip().split("\n")]
+        lines = result.stdout.strip().split("\n")
+        return actions.parse_status_lines(f"{host_conf["hostname"]}{i.strip()}" for i in lines)
     return None
 
 
@@ -368,7 +378,7 @@ def submit_job(
 
 
 def post_submit_set_values(
-    database: pl.DataFrame,
+    database: pl.LazyFrame,
     host_conf: dict[str, Any],
     job_id: str,
     job_name: str,
@@ -383,11 +393,11 @@ def post_submit_set_values(
 
     This function converts the remote job ID into a unique global ID, initializes
     the job record via `actions.add_job`, and ensures that the necessary remote-tracking
-    columns exist in the DataFrame. It then populates the host, remote ID, and
+    columns exist in the LazyFrame. It then populates the host, remote ID, and
     remote directory paths.
 
     Args:
-        database (pl.DataFrame): The current job database DataFrame.
+        database (pl.LazyFrame): The current job database LazyFrame.
         host_conf (dict[str, Any]): Configuration dictionary containing the 'hostname'.
         job_id (str): The raw job ID returned by the remote scheduler.
         job_name (str): The name assigned to the job.
@@ -397,13 +407,13 @@ def post_submit_set_values(
         comment (Optional[str]): An optional comment to associate with the job.
 
     Returns:
-        pl.DataFrame: The updated database DataFrame containing the new job
+        pl.LazyFrame: The updated database LazyFrame containing the new job
             record and its associated remote metadata.
     """
     job_id = f"{host_conf["hostname"]}{job_id}"
     database = actions.add_job(database, job_id, job_name, job_dir, job_script)
     for col in ["Host", "Remote_ID", "Remote_directory"]:
-        if col not in database.schema:
+        if col not in database.collect_schema():
             database = database.with_columns(pl.lit(None, dtype=pl.String).alias(col))
     database = actions.set_value(database, job_id, "Host", host_conf["hostname"])
     database = actions.set_value(
@@ -37,6 +37,7 @@ from trackjobs.lib.cli_flags import opt_dir
 from trackjobs.lib.cli_flags import requires_id
 from trackjobs.lib.cli_flags import requires_name
 from trackjobs.lib.cli_flags import requires_script
+from trackjobs.lib.default import COL_CHECKED
 from trackjobs.remote import actions_remote
 
 
@@ -73,10 +74,10 @@ def remote(ctx, host: str):
 @remote.command(
     "pull",
     short_help="""Pull jobs database from remote host and merge with local one.
-    Note that the job_db.polars file must exist on the remote host.""",
+    Note that the job database must exist on the remote host.""",
 )
 @click.pass_obj
-def remote_pull(obj: dict) -> pl.DataFrame:
+def remote_pull(obj: dict) -> pl.LazyFrame:
     """Command to synchronize the local job database with data from a remote host.
 
     This command extracts the connection, host configuration, and local database
@@ -86,12 +87,12 @@ def remote_pull(obj: dict) -> pl.DataFrame:
 
     Args:
         obj (Dict): The Click context object containing:
-            - 'db': The current local Polars DataFrame.
+            - 'db': The current local Polars LazyFrame.
             - 'conn': The active Fabric connection to the remote host.
             - 'host_conf': The configuration dictionary for the target host.
 
     Returns:
-        pl.DataFrame: The merged Polars DataFrame containing synchronized
+        pl.LazyFrame: The merged Polars LazyFrame containing synchronized
             data from both local and remote sources.
 
     Note:
@@ -106,7 +107,7 @@ def remote_pull(obj: dict) -> pl.DataFrame:
 @remote.command(
     "push",
     short_help="""Push jobs from local database to remote host databaes.
-        Only jobs from the selected host will be pushed. Note that the job_db.polars file must
+        Only jobs from the selected host will be pushed. Note that the job database must
         exist on the remote host.""",
 )
 @click.pass_obj
@@ -120,7 +121,7 @@ def remote_push(obj: dict):
 
     Args:
         obj (Dict): The Click context object containing:
-            - 'db': The current local Polars DataFrame.
+            - 'db': The current local Polars LazyFrame.
             - 'conn': The active Fabric connection to the remote host.
             - 'host_conf': The configuration dictionary for the target host.
 
@@ -166,14 +167,14 @@ def remote_check_status(obj: dict, print_unchecked: bool):
 
     Args:
         obj (Dict): The Click context object containing:
-            - 'db': The current local Polars DataFrame.
+            - 'db': The current local Polars LazyFrame.
             - 'conn': The active Fabric connection to the remote host.
             - 'host_conf': The configuration dictionary for the target host.
         print_unchecked (bool): A flag indicating whether to print the
             list of unchecked jobs for the current host after processing.
 
     Returns:
-        pl.DataFrame: The updated database DataFrame with current job statuses.
+        pl.LazyFrame: The updated database LazyFrame with current job statuses.
 
     Note:
         When `print_unchecked` is True, the function adjusts Polars configuration
@@ -197,13 +198,13 @@ def remote_check_status(obj: dict, print_unchecked: bool):
 
     if print_unchecked:
         print_database = (
-            database.filter(pl.col("Checked?").eq(False))
+            database.filter(pl.col(COL_CHECKED).eq(False))
             .filter(pl.col("Host").eq(host_conf["hostname"]))
             .select(pl.col("*").exclude("Directory"))
             .select(pl.col("*").exclude("Remote_directory"))
         )
         with pl.Config(tbl_cols=-1, set_tbl_rows=-1):
-            click.echo(print_database)
+            click.echo(print_database.collect())
 
     return database
 
@@ -227,7 +228,7 @@ def remote_check_status(obj: dict, print_unchecked: bool):
     type=str,
     help="If set, will start an array job with array indices from a[0] to a[1].",
 )
-def remote_submit(obj, job_script, job_name, job_dir, comment, array) -> pl.DataFrame | None:
+def remote_submit(obj, job_script, job_name, job_dir, comment, array) -> pl.LazyFrame | None:
     # pylint: disable=too-many-arguments
     # pylint: disable=too-many-positional-arguments
     """Submits a job to a remote host and records the submission in the local database.
@@ -241,7 +242,7 @@ def remote_submit(obj, job_script, job_name, job_dir, comment, array) -> pl.Data
 
     Args:
         obj (Dict): The Click context object containing:
-            - 'db': The current local Polars DataFrame.
+            - 'db': The current local Polars LazyFrame.
             - 'conn': The active Fabric connection to the remote host.
             - 'host_conf': The configuration dictionary for the target host.
         job_script (str): The name/path of the script to be submitted.
@@ -252,7 +253,7 @@ def remote_submit(obj, job_script, job_name, job_dir, comment, array) -> pl.Data
             array jobs. Note: Currently raises NotImplementedError if provided.
 
     Returns:
-        Optional[pl.DataFrame]: The updated database DataFrame if submission
+        Optional[pl.LazyFrame]: The updated database LazyFrame if submission
             was successful; None if the submission failed.
 
     Raises:
@@ -293,7 +294,7 @@ def remote_submit(obj, job_script, job_name, job_dir, comment, array) -> pl.Data
 @click.pass_obj
 @requires_id
 @opt_comment
-def remote_cancel(obj, job_id, comment) -> pl.DataFrame:
+def remote_cancel(obj, job_id, comment) -> pl.LazyFrame:
     """Cancels a remote job and updates its status in the local database.
 
     This command extracts the global job ID, strips the hostname prefix to
@@ -303,7 +304,7 @@ def remote_cancel(obj, job_id, comment) -> pl.DataFrame:
 
     Args:
         obj (Dict): The Click context object containing:
-            - 'db': The current local Polars DataFrame.
+            - 'db': The current local Polars LazyFrame.
             - 'conn': The active Fabric connection to the remote host.
             - 'host_conf': The configuration dictionary for the target host.
         job_id (str): The unique global job ID (including hostname prefix).
@@ -311,7 +312,7 @@ def remote_cancel(obj, job_id, comment) -> pl.DataFrame:
             was cancelled.
 
     Returns:
-        pl.DataFrame: The updated database DataFrame with the job status
+        pl.LazyFrame: The updated database LazyFrame with the job status
             set to 'CANCELLED'.
 
     Note: